@@ -1,10 +1,15 @@
 import streamlit as st
+from genie_cache import warm_up
 
 st.set_page_config(
     page_title="Pronto Mitra",
     page_icon="assets/lnt_logo.png",
 )
 
+# Preload heavy imports and the default Pronto Genie dataset and models in the
+# background, once per server process; the page renders without waiting for it
+warm_up_status = warm_up()
+
 # Correctly capitalized "Pronto Mitra" in sidebar
 st.sidebar.markdown("<h1 style='font-size: 24px;'>Pronto Mitra</h1>", unsafe_allow_html=True)
 
@@ -15,6 +20,14 @@ st.write("# Welcome to Pronto Mitra 👋")
 
 st.sidebar.success("Select a Tool above.")
 
+with st.sidebar.expander("Warm-up timings"):
+    if warm_up_status['state'] == 'running':
+        st.write("Warm-up in progress...")
+    elif warm_up_status['state'] == 'failed':
+        st.error(f"Warm-up failed: {warm_up_status['error']}")
+    for step, seconds in dict(warm_up_status['timings']).items():
+        st.write(f"{step}: {seconds:.2f} s")
+
 st.markdown(
     """
     Pronto Mitra serves as the central dashboard in our project, integrating two key models to enhance our document management and predictive capabilities. The dashboard is designed to provide comprehensive insights and predictions to streamline our processes and improve efficiency.
@@ -0,0 +1,214 @@
+import streamlit as st
+from streamlit.logger import get_logger
+import os
+import threading
+import time
+
+# Heavy libraries (pandas, numpy, scikit-learn) are imported inside the functions
+# that need them so that opening a page does not pay for them up front.
+
+# Path to an Excel file that Pronto Genie falls back to and preloads at server start
+DEFAULT_DATA_ENV = "PRONTO_GENIE_DEFAULT_DATA"
+
+REQUIRED_COLUMNS = ['createdOn', 'jobcode', 'module']
+
+# Streamlit's logger is configured by the server, so these lines reach its log
+logger = get_logger(__name__)
+
+# The cached functions below also run in the warm-up thread, which has no script run
+# to draw a spinner in; the page shows its own spinner around training instead.
+
+# version is only part of the cache key: for a path it changes when the file is
+# replaced, so a refreshed default dataset is reloaded instead of served from cache
+@st.cache_data(show_spinner=False)
+def load_data(data_1_file, version=None):
+    import pandas as pd
+
+    data_1 = pd.read_excel(data_1_file)
+    return data_1
+
+@st.cache_data(show_spinner=False)
+def preprocess_data(data_1):
+    import pandas as pd
+
+    # Convert 'createdOn' to datetime
+    data_1['createdOn'] = pd.to_datetime(data_1['createdOn'], errors='coerce')
+    data_1 = data_1.dropna(subset=['createdOn'])  # Drop rows with invalid dates
+
+    # Ensure 'jobcode' and 'module' are treated as strings
+    data_1['jobcode'] = data_1['jobcode'].astype(str)
+    data_1['module'] = data_1['module'].astype(str)
+
+    return data_1
+
+def file_version(data_1_file):
+    # Modification time and size of a file on disk; None for uploads, which are keyed by content
+    if isinstance(data_1_file, str):
+        return os.path.getmtime(data_1_file), os.path.getsize(data_1_file)
+    return None
+
+def load_and_prepare(data_1_file):
+    data_1 = load_data(data_1_file, file_version(data_1_file))
+
+    # Ensure required columns are present
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in data_1.columns]
+    if missing_columns:
+        source = f"Default dataset {os.path.basename(data_1_file)}" if isinstance(data_1_file, str) else "Uploaded file"
+        raise ValueError(f"{source} is missing the following required columns: {', '.join(missing_columns)}")
+
+    data_1 = preprocess_data(data_1)
+
+    # Extract year and month from 'createdOn' column in data_1
+    data_1['year'] = data_1['createdOn'].dt.year
+    data_1['month'] = data_1['createdOn'].dt.month
+
+    return data_1
+
+@st.cache_data(show_spinner=False)
+def process_and_train(data_1):
+    import pandas as pd
+    import numpy as np
+    from sklearn.preprocessing import OneHotEncoder, PolynomialFeatures
+    from sklearn.linear_model import Ridge
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.model_selection import cross_val_score
+
+    # Convert columns to datetime
+    data_1['createdOn'] = pd.to_datetime(data_1['createdOn'])
+
+    # Extract day, month, year, and day of the week from 'createdOn' in data_1
+    data_1['day'] = data_1['createdOn'].dt.day
+    data_1['month'] = data_1['createdOn'].dt.month
+    data_1['year'] = data_1['createdOn'].dt.year
+    data_1['day_of_week'] = data_1['createdOn'].dt.dayofweek
+
+    # Calculate the number of projects (unique job codes) for each month and year
+    projects_data = data_1.groupby(['year', 'month'])['jobcode'].nunique().reset_index(name='No of Projects')
+
+    # Group by day, month, year, day_of_week, module to get the count of documents received
+    document_counts = data_1.groupby(['day', 'month', 'year', 'day_of_week', 'module']).size().reset_index(name='count')
+
+    # Merge with projects data to get the number of projects for each month and year
+    merged_data = document_counts.merge(projects_data, how='left', left_on=['month', 'year'], right_on=['month', 'year'])
+
+    # Fill missing values in 'No of Projects' with 0 (if any)
+    merged_data['No of Projects'] = merged_data['No of Projects'].fillna(0)
+
+    # Function to train a model for a specific document type
+    def train_model_for_module(module):
+        module_data = merged_data[merged_data['module'] == module]
+
+        # Define features and target variable
+        categorical_features = ['day', 'month', 'year', 'day_of_week']
+        X = module_data[categorical_features + ['No of Projects']]
+        y_target = module_data['count']
+
+        # One-hot encode the categorical variables
+        encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
+        encoded_columns = encoder.fit_transform(module_data[categorical_features])
+        encoded_columns_df = pd.DataFrame(encoded_columns, columns=encoder.get_feature_names_out(categorical_features))
+
+        # Prepare the transformer and pipeline
+        preprocessor = ColumnTransformer(
+            transformers=[
+                ('cat', encoder, categorical_features)
+            ],
+            remainder='passthrough'
+        )
+
+        # Use cross-validation to find the best degree for the polynomial features
+        best_degree = 1
+        best_score = float('-inf')
+
+        for degree in range(1, 4):  # Test polynomial degrees from 1 to 3
+            model = Pipeline(steps=[
+                ('preprocessor', preprocessor),
+                ('poly', PolynomialFeatures(degree=degree, include_bias=False)),
+                ('regressor', Ridge(alpha=1.0))  # Regularization parameter alpha can be tuned
+            ])
+
+            scores = cross_val_score(model, X, y_target, cv=5, scoring='neg_mean_squared_error')
+            mean_score = np.mean(scores)
+
+            if mean_score > best_score:
+                best_score = mean_score
+                best_degree = degree
+
+        # Use the best degree for the final model
+        model = Pipeline(steps=[
+            ('preprocessor', preprocessor),
+            ('poly', PolynomialFeatures(degree=best_degree, include_bias=False)),
+            ('regressor', Ridge(alpha=1.0))
+        ])
+
+        # Fit the model
+        model.fit(X, y_target)
+        return model
+
+    # Train models for each document type
+    modules = merged_data['module'].unique()
+    models = {module: train_model_for_module(module) for module in modules}
+
+    return models, modules, projects_data
+
+def default_data_path():
+    # Returns the configured default dataset, or None if it is unset or missing
+    path = os.environ.get(DEFAULT_DATA_ENV)
+    if path and os.path.isfile(path):
+        return path
+    return None
+
+def warm_up():
+    # Starts the warm-up in the background and returns its status without waiting
+    path = default_data_path()
+    version = file_version(path) if path else None
+    return _start_warm_up(path, version)
+
+# Runs once per server process and default dataset version: the first script run
+# after start-up (or after the file changes) starts a thread that imports the heavy
+# libraries and preloads the default dataset and its models into the shared
+# st.cache_data entries above, so the first Pronto Genie visit is served from cache.
+@st.cache_resource(show_spinner=False)
+def _start_warm_up(path, version):
+    status = {'state': 'running', 'timings': {}, 'error': None}
+    thread = threading.Thread(target=_run_warm_up, args=(path, status), name="pronto-genie-warm-up", daemon=True)
+    thread.start()
+    return status
+
+def _run_warm_up(path, status):
+    timings = status['timings']
+    try:
+        start = time.perf_counter()
+        import pandas
+        import numpy
+        timings['Import pandas/numpy'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        import sklearn.linear_model
+        import sklearn.model_selection
+        import sklearn.preprocessing
+        timings['Import scikit-learn'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        import matplotlib.pyplot
+        timings['Import matplotlib'] = time.perf_counter() - start
+
+        # Loading and training only happen when a default dataset is configured
+        if path is not None:
+            start = time.perf_counter()
+            data_1 = load_and_prepare(path)
+            timings['Load default dataset'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            process_and_train(data_1)
+            timings['Train models'] = time.perf_counter() - start
+
+        status['state'] = 'done'
+    except Exception as e:
+        status['error'] = str(e)
+        status['state'] = 'failed'
+        logger.warning("Pronto Genie warm-up failed for %s: %s", path, e)
+
+    for step, seconds in timings.items():
+        logger.info("Pronto Genie warm-up: %s took %.2f s", step, seconds)
@@ -1,16 +1,9 @@
 import streamlit as st
-import pandas as pd
-from sklearn.preprocessing import OneHotEncoder, PolynomialFeatures
-from sklearn.linear_model import Ridge
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.model_selection import cross_val_score
-import numpy as np
 import warnings
 import os
 import time
 import datetime
-import matplotlib.pyplot as plt
+from genie_cache import default_data_path, load_and_prepare, process_and_train
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -20,120 +13,25 @@ st.sidebar.image('assets/logo_1_1.png', width=250)  # Adjust path and width as n
 st.sidebar.title("Upload Documents Data File")
 data_1_file = st.sidebar.file_uploader("Upload File", type=["xlsx"])
 
+# Fall back to the configured default dataset (preloaded at server start) if no file is uploaded
+default_data_file = default_data_path()
+
 # Display green box to upload file
 if data_1_file is None:
-    st.sidebar.info("🟢 Upload a file to get started!")
+    if default_data_file:
+        st.sidebar.info(f"Using default dataset: {os.path.basename(default_data_file)}")
+    else:
+        st.sidebar.info("🟢 Upload a file to get started!")
 
 # Add a link to view the format with an image
 with st.sidebar.expander("View data format"):
     st.image('assets/excelformat.png', use_column_width=True)  # Path to your image in the assets folder
 
-@st.cache_data
-def load_data(data_1_file):
-    data_1 = pd.read_excel(data_1_file)
-    return data_1
-
-@st.cache_data
-def preprocess_data(data_1):
-    # Ensure required columns are present
-    required_columns = ['createdOn', 'jobcode', 'module']
-    missing_columns = [col for col in required_columns if col not in data_1.columns]
-    if missing_columns:
-        st.error(f"Uploaded file is missing the following required columns: {', '.join(missing_columns)}")
-        return None
-
-    # Convert 'createdOn' to datetime
-    data_1['createdOn'] = pd.to_datetime(data_1['createdOn'], errors='coerce')
-    data_1 = data_1.dropna(subset=['createdOn'])  # Drop rows with invalid dates
-
-    # Ensure 'jobcode' and 'module' are treated as strings
-    data_1['jobcode'] = data_1['jobcode'].astype(str)
-    data_1['module'] = data_1['module'].astype(str)
-
-    return data_1
-
-@st.cache_data
-def process_and_train(data_1):
-    # Convert columns to datetime
-    data_1['createdOn'] = pd.to_datetime(data_1['createdOn'])
-
-    # Extract day, month, year, and day of the week from 'createdOn' in data_1
-    data_1['day'] = data_1['createdOn'].dt.day
-    data_1['month'] = data_1['createdOn'].dt.month
-    data_1['year'] = data_1['createdOn'].dt.year
-    data_1['day_of_week'] = data_1['createdOn'].dt.dayofweek
-
-    # Calculate the number of projects (unique job codes) for each month and year
-    projects_data = data_1.groupby(['year', 'month'])['jobcode'].nunique().reset_index(name='No of Projects')
-
-    # Group by day, month, year, day_of_week, module to get the count of documents received
-    document_counts = data_1.groupby(['day', 'month', 'year', 'day_of_week', 'module']).size().reset_index(name='count')
-
-    # Merge with projects data to get the number of projects for each month and year
-    merged_data = document_counts.merge(projects_data, how='left', left_on=['month', 'year'], right_on=['month', 'year'])
-
-    # Fill missing values in 'No of Projects' with 0 (if any)
-    merged_data['No of Projects'] = merged_data['No of Projects'].fillna(0)
-
-    # Function to train a model for a specific document type
-    def train_model_for_module(module):
-        module_data = merged_data[merged_data['module'] == module]
-
-        # Define features and target variable
-        categorical_features = ['day', 'month', 'year', 'day_of_week']
-        X = module_data[categorical_features + ['No of Projects']]
-        y_target = module_data['count']
-
-        # One-hot encode the categorical variables
-        encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
-        encoded_columns = encoder.fit_transform(module_data[categorical_features])
-        encoded_columns_df = pd.DataFrame(encoded_columns, columns=encoder.get_feature_names_out(categorical_features))
-
-        # Prepare the transformer and pipeline
-        preprocessor = ColumnTransformer(
-            transformers=[
-                ('cat', encoder, categorical_features)
-            ],
-            remainder='passthrough'
-        )
-
-        # Use cross-validation to find the best degree for the polynomial features
-        best_degree = 1
-        best_score = float('-inf')
-
-        for degree in range(1, 4):  # Test polynomial degrees from 1 to 3
-            model = Pipeline(steps=[
-                ('preprocessor', preprocessor),
-                ('poly', PolynomialFeatures(degree=degree, include_bias=False)),
-                ('regressor', Ridge(alpha=1.0))  # Regularization parameter alpha can be tuned
-            ])
-
-            scores = cross_val_score(model, X, y_target, cv=5, scoring='neg_mean_squared_error')
-            mean_score = np.mean(scores)
-
-            if mean_score > best_score:
-                best_score = mean_score
-                best_degree = degree
-
-        # Use the best degree for the final model
-        model = Pipeline(steps=[
-            ('preprocessor', preprocessor),
-            ('poly', PolynomialFeatures(degree=best_degree, include_bias=False)),
-            ('regressor', Ridge(alpha=1.0))
-        ])
-
-        # Fit the model
-        model.fit(X, y_target)
-        return model
-
-    # Train models for each document type
-    modules = merged_data['module'].unique()
-    models = {module: train_model_for_module(module) for module in modules}
-
-    return models, modules, projects_data
-
 # Function to predict documents for a given month and year
 def predict_documents(year, month, no_of_projects, models, modules, selected_module=None):
+    import pandas as pd
+    import numpy as np
+
     try:
         # Generate dates for the entire month
         dates = pd.date_range(start=f'{year}-{month:02d}-01', end=f'{year}-{month:02d}-{pd.Timestamp(year, month, 1).days_in_month}')
@@ -185,6 +83,8 @@ def predict_documents(year, month, no_of_projects, models, modules, selected_mod
 
 # Function to predict future documents based on input parameters
 def predict_future_docs(num_projects_next_month, start_date, months, models, modules, selected_module=None):
+    import pandas as pd
+
     try:
         start_date_obj = pd.to_datetime(start_date)
         predictions = []
@@ -214,19 +114,17 @@ def main():
 
 
     # Wait for file uploads
-    if data_1_file:
+    data_source = data_1_file or default_data_file
+    if data_source:
+        import pandas as pd
+        import matplotlib.pyplot as plt
+
         try:
-            data_1 = load_data(data_1_file)
-            data_1 = preprocess_data(data_1)
-            if data_1 is None:
+            try:
+                data_1 = load_and_prepare(data_source)
+            except ValueError as e:
+                st.error(str(e))
                 return
-
-            # Convert the 'createdOn' column to datetime
-            data_1['createdOn'] = pd.to_datetime(data_1['createdOn'], errors='coerce')
-
-            # Extract year and month from 'createdOn' column in data_1
-            data_1['year'] = data_1['createdOn'].dt.year
-            data_1['month'] = data_1['createdOn'].dt.month
             
             with st.spinner('Processing....'):
                 models, modules, projects_data = process_and_train(data_1)
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 import time  # Add this import for timing animations
+from viz_sketches import TDigest, add_percentile_columns, build_sketches, percentile_columns, percentile_row
+
+# pandas and matplotlib are imported inside the functions that use them so the
+# page renders its upload widgets without paying for those imports first
 
 # Function to simulate document processing animation
 def process_animation():
@@ -14,6 +16,8 @@ def process_animation():
 
 # Function to create line plots
 def create_line_plot(data, x, ys, title, xlabel, ylabel):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     for y in ys:
         plt.plot(data[x], data[y], marker='o', label=y)
@@ -26,6 +30,8 @@ def create_line_plot(data, x, ys, title, xlabel, ylabel):
 
 # Function to create bar plots
 def create_bar_plot(data, x, y, title, xlabel, ylabel):
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     plt.bar(data[x], data[y])
     plt.title(title)
@@ -52,6 +58,8 @@ if uploaded_file is None:
 # Function to load and process data
 def load_data(file):
     if file is not None:
+        import pandas as pd
+
         try:
             # Show processing animation
             process_animation()
@@ -93,6 +101,9 @@ if uploaded_file is not None:
     data = load_data(uploaded_file)
 
     if data is not None:
+        # Quantile sketches per (year, month, module, employee), built once per file
+        sketches = build_sketches(data)
+
         # Mapping of month names to numbers
         months = {
             'January': 1, 'February': 2, 'March': 3, 'April': 4,
@@ -108,6 +119,17 @@ if uploaded_file is not None:
         # Get the corresponding month number
         month_input = months[month_name]
 
+        # Metric and SLA threshold for the percentile columns
+        percentile_metrics = {
+            'Overall Time': 'time_overall',
+            'Time to Regularize': 'time_to_regularize',
+            'Time to Authorize': 'time_to_authorize'
+        }
+        percentile_metric_name = st.sidebar.selectbox('Percentile Metric', list(percentile_metrics.keys()))
+        percentile_metric = percentile_metrics[percentile_metric_name]
+        sla_days = st.sidebar.number_input('SLA Threshold (days)', min_value=0.0, value=2.0, step=0.5)
+        percentile_caption = f"Percentiles of {percentile_metric_name}; % Over SLA counts documents taking more than {sla_days:g} days (exactly {sla_days:g} days is within SLA)."
+
         # Button to display month-wise summary
         if st.sidebar.button('Predict', key='predict'):
             # Show processing animation
@@ -132,7 +154,11 @@ if uploaded_file is not None:
                 summary_overall = summary_overall[['allocatedTo', 'createdOn', 'time_to_regularize', 'time_to_authorize', 'time_overall']]
                 summary_overall.columns = ['Employee', 'Number of Documents', 'Avg Time to Regularize (days)', 'Avg Time to Authorize (days)', 'Avg Overall Time (days)']
 
+                # Add percentiles and SLA share for the selected metric from the merged sketches
+                summary_overall = add_percentile_columns(summary_overall, sketches, percentile_metric, sla_days, ('allocatedTo',), year_input, month_input)
+
                 st.header(f"Overall Summary for {month_name} {year_input}")
+                st.caption(percentile_caption)
                 st.write(summary_overall)
 
                 # Summarize the data by module and employee
@@ -150,7 +176,11 @@ if uploaded_file is not None:
                 summary_module = summary_module[['module', 'allocatedTo', 'createdOn', 'time_to_regularize', 'time_to_authorize', 'time_overall']]
                 summary_module.columns = ['Module', 'Employee', 'Number of Documents', 'Avg Time to Regularize (days)', 'Avg Time to Authorize (days)', 'Avg Overall Time (days)']
 
+                # Add percentiles and SLA share for the selected metric from the merged sketches
+                summary_module = add_percentile_columns(summary_module, sketches, percentile_metric, sla_days, ('module', 'allocatedTo'), year_input, month_input)
+
                 st.header(f"Module-wise Summary for {month_name} {year_input}")
+                st.caption(percentile_caption)
 
                 # Display individual tables for each employee
                 employees = summary_module['Employee'].unique()
@@ -188,6 +218,11 @@ if st.sidebar.button('Calculate Overall Avg Time for Entire Data', key='overall_
     st.write(f"Avg Time to Authorize: {overall_avg['time_to_authorize']:.2f} days")
     st.write(f"Avg Overall Time: {overall_avg['time_overall']:.2f} days")
 
+    # Percentiles for the selected metric over the entire data, merged from all sketches
+    overall_digest = TDigest.merge(digests[percentile_metric] for digests in sketches.values())
+    for column, value in zip(percentile_columns(), percentile_row(overall_digest, sla_days)):
+        st.write(f"{column} for {percentile_metric_name}: {value:.2f}")
+
     # Summarize the overall data by employee
     summary_overall_all = data.groupby('allocatedTo').agg({
         'time_to_regularize': 'mean',
@@ -203,7 +238,11 @@ if st.sidebar.button('Calculate Overall Avg Time for Entire Data', key='overall_
     summary_overall_all = summary_overall_all[['allocatedTo', 'createdOn', 'time_to_regularize', 'time_to_authorize', 'time_overall']]
     summary_overall_all.columns = ['Employee', 'Number of Documents', 'Avg Time to Regularize (days)', 'Avg Time to Authorize (days)', 'Avg Overall Time (days)']
 
+    # Add percentiles and SLA share for the selected metric from the merged sketches
+    summary_overall_all = add_percentile_columns(summary_overall_all, sketches, percentile_metric, sla_days, ('allocatedTo',))
+
     st.header("Overall Summary for Entire Data")
+    st.caption(percentile_caption)
     st.write(summary_overall_all)
 
     # Summarize the overall data by module and employee
@@ -221,7 +260,11 @@ if st.sidebar.button('Calculate Overall Avg Time for Entire Data', key='overall_
     summary_module_all = summary_module_all[['module', 'allocatedTo', 'createdOn', 'time_to_regularize', 'time_to_authorize', 'time_overall']]
     summary_module_all.columns = ['Module', 'Employee', 'Number of Documents', 'Avg Time to Regularize (days)', 'Avg Time to Authorize (days)', 'Avg Overall Time (days)']
 
+    # Add percentiles and SLA share for the selected metric from the merged sketches
+    summary_module_all = add_percentile_columns(summary_module_all, sketches, percentile_metric, sla_days, ('module', 'allocatedTo'))
+
     st.header("Module-wise Summary for Entire Data")
+    st.caption(percentile_caption)
 
     # Display individual tables for each employee
     employees_all = summary_module_all['Employee'].unique()
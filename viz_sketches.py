@@ -0,0 +1,169 @@
+import streamlit as st
+import bisect
+import math
+
+# Mergeable quantile sketches (merging t-digest) for ProntoViz processing times.
+# One digest is built per (year, month, module, employee) and metric while the data
+# is loaded; any filter is then answered by merging digests, never by rescanning rows.
+
+# Processing-time columns that get a sketch
+METRICS = ['time_to_regularize', 'time_to_authorize', 'time_overall']
+
+# Key order of the sketch table
+KEY_COLUMNS = ['created_year', 'created_month', 'module', 'allocatedTo']
+
+# Higher compression keeps more centroids: more accurate tails, more memory
+DEFAULT_COMPRESSION = 100
+
+# Column names of the sketch keys in the ProntoViz summary tables
+DISPLAY_NAMES = {'module': 'Module', 'allocatedTo': 'Employee'}
+
+class TDigest:
+    def __init__(self, centroids=(), min_value=math.nan, max_value=math.nan, compression=DEFAULT_COMPRESSION):
+        # centroids: list of (mean, weight) sorted by mean
+        self.centroids = list(centroids)
+        self.count = sum(weight for _, weight in self.centroids)
+        self.min = min_value
+        self.max = max_value
+        self.compression = compression
+
+    @classmethod
+    def from_values(cls, values, compression=DEFAULT_COMPRESSION):
+        # NaN (e.g. documents not authorized yet) is skipped, as pandas' mean does
+        values = sorted(value for value in values if value == value)
+        if not values:
+            return cls(compression=compression)
+        return cls._compress([(value, 1) for value in values], values[0], values[-1], compression)
+
+    @classmethod
+    def merge(cls, digests, compression=DEFAULT_COMPRESSION):
+        digests = [digest for digest in digests if digest.count]
+        if not digests:
+            return cls(compression=compression)
+        centroids = sorted(centroid for digest in digests for centroid in digest.centroids)
+        min_value = min(digest.min for digest in digests)
+        max_value = max(digest.max for digest in digests)
+        return cls._compress(centroids, min_value, max_value, compression)
+
+    @classmethod
+    def _compress(cls, centroids, min_value, max_value, compression):
+        # Greedy merge of sorted centroids under the k1 scale function, which
+        # allows large centroids in the middle and keeps the tails fine-grained
+        total = sum(weight for _, weight in centroids)
+
+        def k(q):
+            return compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+        def k_inverse(value):
+            return (math.sin(min(value * 2 * math.pi / compression, math.pi / 2)) + 1) / 2
+
+        merged = []
+        weight_so_far = 0
+        current_mean, current_weight = centroids[0]
+        q_limit = k_inverse(k(0) + 1)
+
+        for mean, weight in centroids[1:]:
+            if (weight_so_far + current_weight + weight) / total <= q_limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                merged.append((current_mean, current_weight))
+                weight_so_far += current_weight
+                q_limit = k_inverse(k(weight_so_far / total) + 1)
+                current_mean, current_weight = mean, weight
+        merged.append((current_mean, current_weight))
+
+        return cls(merged, min_value, max_value, compression)
+
+    def _points(self):
+        # Piecewise-linear CDF through (min, 0), each centroid's mid-point and (max, count)
+        points = [(self.min, 0)]
+        cumulative = 0
+        for mean, weight in self.centroids:
+            points.append((mean, cumulative + weight / 2))
+            cumulative += weight
+        points.append((self.max, self.count))
+        return points
+
+    def quantile(self, q):
+        if not self.count:
+            return math.nan
+        points = self._points()
+        ranks = [rank for _, rank in points]
+        target = min(max(q, 0), 1) * self.count
+        i = max(bisect.bisect_left(ranks, target), 1)
+        (x0, r0), (x1, r1) = points[i - 1], points[min(i, len(points) - 1)]
+        if r1 == r0:
+            return x1
+        return x0 + (x1 - x0) * (target - r0) / (r1 - r0)
+
+    def cdf(self, x):
+        # Estimated share of values <= x. A weight-1 centroid is a single exact value
+        # and counts as a step; only centroids that merged several values are spread
+        # evenly between the mid-points to their neighbours (or min/max at the ends).
+        if not self.count:
+            return math.nan
+        if x < self.min:
+            return 0.0
+        if x >= self.max:
+            return 1.0
+        below = 0
+        last = len(self.centroids) - 1
+        for i, (mean, weight) in enumerate(self.centroids):
+            if weight == 1:
+                if mean <= x:
+                    below += 1
+                continue
+            lower = self.min if i == 0 else (self.centroids[i - 1][0] + mean) / 2
+            upper = self.max if i == last else (mean + self.centroids[i + 1][0]) / 2
+            if x >= upper:
+                below += weight
+            elif x >= lower:
+                below += weight * (x - lower) / (upper - lower)
+        return below / self.count
+
+@st.cache_data
+def build_sketches(data):
+    # Single pass over the loaded rows: {(year, month, module, employee): {metric: TDigest}}
+    # Rows with a missing module or employee keep their own NaN key so that the
+    # per-employee and entire-data percentiles cover the same documents as the means
+    sketches = {}
+    for key, group in data.groupby(KEY_COLUMNS, dropna=False):
+        sketches[key] = {metric: TDigest.from_values(group[metric].tolist()) for metric in METRICS}
+    return sketches
+
+def summarize_sketches(sketches, metric, sla_days, group_by=('allocatedTo',), year=None, month=None):
+    # Percentile and SLA table for the selected year/month, one row per group_by value
+    import pandas as pd
+
+    positions = [KEY_COLUMNS.index(column) for column in group_by]
+    groups = {}
+    for key, digests in sketches.items():
+        if year is not None and key[0] != year:
+            continue
+        if month is not None and key[1] != month:
+            continue
+        group_key = tuple(key[position] for position in positions)
+        groups.setdefault(group_key, []).append(digests[metric])
+
+    rows = []
+    for group_key, digests in groups.items():
+        digest = TDigest.merge(digests)
+        rows.append(list(group_key) + percentile_row(digest, sla_days))
+
+    columns = list(group_by) + percentile_columns()
+    return pd.DataFrame(rows, columns=columns)
+
+def add_percentile_columns(summary, sketches, metric, sla_days, group_by, year=None, month=None):
+    # Left-merge the percentile and SLA columns onto a summary table keyed by Module/Employee
+    percentiles = summarize_sketches(sketches, metric, sla_days, group_by, year, month)
+    percentiles = percentiles.rename(columns=DISPLAY_NAMES)
+    return summary.merge(percentiles, how='left', on=[DISPLAY_NAMES[column] for column in group_by])
+
+def percentile_row(digest, sla_days):
+    # A document is over SLA when its time is strictly greater than sla_days
+    over_sla = (1 - digest.cdf(sla_days)) * 100 if digest.count else math.nan
+    return [digest.quantile(0.5), digest.quantile(0.9), digest.quantile(0.99), over_sla]
+
+def percentile_columns():
+    return ['Median (days)', 'P90 (days)', 'P99 (days)', '% Over SLA']